@@ -1,16 +1,34 @@
 """Database connection pool with automatic JSON serialization."""
 
-import json
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import ClassVar
+from typing import Any, ClassVar
 
 import asyncpg
+import orjson
 from loguru import logger
 
 from coupon_mention_tracker.core.config import Settings
 
 
+_JSONB_VERSION = b"\x01"
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value for asyncpg's text JSON codec."""
+    return orjson.dumps(value).decode()
+
+
+def _jsonb_encode(value: Any) -> bytes:
+    """Serialize a value to the jsonb binary wire format."""
+    return _JSONB_VERSION + orjson.dumps(value)
+
+
+def _jsonb_decode(data: bytes) -> Any:
+    """Parse the jsonb binary wire format (version byte + JSON text)."""
+    return orjson.loads(memoryview(data)[1:])
+
+
 class DatabasePool:
     """Manages the asyncpg connection pool."""
 
@@ -23,8 +41,12 @@ class DatabasePool:
             logger.info("[DATABASE] Creating asyncpg connection pool")
             cls._pool = await asyncpg.create_pool(
                 dsn=settings.database_url_str,
-                min_size=1,
-                max_size=10,
+                min_size=settings.db_pool_min_size,
+                max_size=settings.db_pool_max_size,
+                max_queries=settings.db_pool_max_queries,
+                max_inactive_connection_lifetime=(
+                    settings.db_pool_max_inactive_lifetime
+                ),
                 command_timeout=60,
                 init=cls._init_connection,
             )
@@ -34,15 +56,16 @@ class DatabasePool:
         """Initialize connection with JSON codecs."""
         await conn.set_type_codec(
             "json",
-            encoder=json.dumps,
-            decoder=json.loads,
+            encoder=_json_dumps,
+            decoder=orjson.loads,
             schema="pg_catalog",
         )
         await conn.set_type_codec(
             "jsonb",
-            encoder=json.dumps,
-            decoder=json.loads,
+            encoder=_jsonb_encode,
+            decoder=_jsonb_decode,
             schema="pg_catalog",
+            format="binary",
         )
 
     @classmethod
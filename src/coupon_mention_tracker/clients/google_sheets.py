@@ -1,6 +1,7 @@
 """Google Sheets client for fetching coupon data using native API."""
 
 import json
+from functools import lru_cache
 from typing import Any
 
 from google.oauth2 import service_account
@@ -12,6 +13,30 @@ from loguru import logger
 GOOGLE_API_SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
 
 
+@lru_cache(maxsize=4)
+def _build_sheets_service(credentials_json: str) -> Any:
+    """Build a Google Sheets API service, cached per credentials string.
+
+    Args:
+        credentials_json: Service account credentials as JSON string.
+
+    Returns:
+        Google Sheets API service resource.
+    """
+    credentials_info = json.loads(credentials_json)
+    credentials = service_account.Credentials.from_service_account_info(
+        credentials_info,
+        scopes=GOOGLE_API_SCOPES,
+    )
+    return build(
+        "sheets",
+        "v4",
+        credentials=credentials,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
 class GoogleSheetsClient:
     """Client for fetching data from Google Sheets using native API."""
 
@@ -40,12 +65,7 @@ class GoogleSheetsClient:
         Returns:
             Google Sheets API service resource.
         """
-        credentials_info = json.loads(credentials_json)
-        credentials = service_account.Credentials.from_service_account_info(
-            credentials_info,
-            scopes=GOOGLE_API_SCOPES,
-        )
-        return build("sheets", "v4", credentials=credentials)
+        return _build_sheets_service(credentials_json)
 
     def _get_sheet_metadata(self) -> dict[str, Any]:
         """Fetch and cache spreadsheet metadata.
@@ -77,51 +97,55 @@ class GoogleSheetsClient:
                 return properties.get("title")
         return None
 
+    @staticmethod
     def _get_column_index_by_name(
-        self,
-        sheet_title: str,
+        headers: list[str],
         column_name: str,
     ) -> int | None:
         """Get column index by header name.
 
         Args:
-            sheet_title: The sheet title.
+            headers: Header row values.
             column_name: The column header name to find.
 
         Returns:
             Column index (0-based) if found, None otherwise.
         """
-        range_notation = f"'{sheet_title}'!1:1"
-        result = (
-            self._service.spreadsheets()
-            .values()
-            .get(spreadsheetId=self._spreadsheet_id, range=range_notation)
-            .execute()
-        )
-
-        headers = result.get("values", [[]])[0]
         try:
             return headers.index(column_name)
         except ValueError:
             return None
 
-    @staticmethod
-    def _column_index_to_letter(column_index: int) -> str:
-        """Convert column index to letter notation.
+    def _get_sheet_rows(self, sheet_title: str) -> list[list[str]]:
+        """Fetch all populated rows of a sheet in a single request.
 
         Args:
-            column_index: Column index (0-based).
+            sheet_title: The sheet title.
 
         Returns:
-            Column letter (A, B, ..., Z, AA, AB, etc.).
+            Sheet rows, header row first.
+
+        Raises:
+            HttpError: If API request fails.
         """
-        result = ""
-        column_index += 1
-        while column_index > 0:
-            column_index -= 1
-            result = chr(column_index % 26 + ord("A")) + result
-            column_index //= 26
-        return result
+        range_notation = f"'{sheet_title}'"
+        try:
+            result = (
+                self._service.spreadsheets()
+                .values()
+                .get(spreadsheetId=self._spreadsheet_id, range=range_notation)
+                .execute()
+            )
+        except HttpError as error:
+            logger.error(
+                "[GOOGLE_SHEETS] Error in get_column_values: "
+                "Failed to fetch values from range {} in spreadsheet {}: {}",
+                range_notation,
+                self._spreadsheet_id,
+                error,
+            )
+            raise
+        return result.get("values", [])
 
     def get_column_values_by_gid_and_name(
         self,
@@ -131,6 +155,9 @@ class GoogleSheetsClient:
     ) -> list[str]:
         """Fetch column values by sheet GID and column name.
 
+        The header row and column values come from one values request;
+        the column is located and sliced locally.
+
         Args:
             gid: The sheet GID (sheetId).
             column_name: The column header name.
@@ -148,36 +175,19 @@ class GoogleSheetsClient:
             msg = f"Sheet with GID {gid} not found"
             raise ValueError(msg)
 
-        column_index = self._get_column_index_by_name(sheet_title, column_name)
+        rows = self._get_sheet_rows(sheet_title)
+        headers = rows[0] if rows else []
+        column_index = self._get_column_index_by_name(headers, column_name)
         if column_index is None:
             msg = f"Column '{column_name}' not found in sheet '{sheet_title}'"
             raise ValueError(msg)
 
-        column_letter = self._column_index_to_letter(column_index)
-        start_row = 2 if skip_header else 1
-        range_notation = (
-            f"'{sheet_title}'!{column_letter}{start_row}:{column_letter}"
-        )
-
-        try:
-            result = (
-                self._service.spreadsheets()
-                .values()
-                .get(spreadsheetId=self._spreadsheet_id, range=range_notation)
-                .execute()
-            )
-        except HttpError as error:
-            logger.error(
-                "[GOOGLE_SHEETS] Error in get_column_values: "
-                "Failed to fetch values from range {} in spreadsheet {}: {}",
-                range_notation,
-                self._spreadsheet_id,
-                error,
-            )
-            raise
-
-        rows = result.get("values", [])
-        return [row[0].strip() for row in rows if row and row[0].strip()]
+        data_rows = rows[1:] if skip_header else rows
+        return [
+            value
+            for row in data_rows
+            if len(row) > column_index and (value := row[column_index].strip())
+        ]
 
     def get_coupons(
         self,
@@ -1,18 +1,15 @@
 """Slack notification service for sending coupon mention alerts."""
 
-from collections import defaultdict
+import asyncio
+from collections.abc import Iterator, Sequence
 from datetime import date
 from http import HTTPStatus
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Self
 
-from slack_sdk.models.blocks import (
-    Block,
-    ContextBlock,
-    DividerBlock,
-    HeaderBlock,
-    MarkdownTextObject,
-    PlainTextObject,
-    SectionBlock,
-)
+import aiohttp
+from slack_sdk.models.blocks import Block
 from slack_sdk.webhook.async_client import AsyncWebhookClient
 
 from coupon_mention_tracker.core.models import (
@@ -23,6 +20,38 @@ from coupon_mention_tracker.core.models import (
 
 
 MAX_DISPLAY_ITEMS = 10
+MAX_BLOCKS_PER_MESSAGE = 50
+_HTTP_TIMEOUT_SECONDS = 30
+
+# Blocks are built as plain Block Kit dicts: the webhook client sends them
+# as-is, skipping slack_sdk model construction and to_dict() validation.
+SlackBlock = dict[str, Any]
+
+
+def _header_block(text: str) -> SlackBlock:
+    """Build a header block with plain text."""
+    return {"type": "header", "text": {"type": "plain_text", "text": text}}
+
+
+def _context_block(text: str) -> SlackBlock:
+    """Build a context block with a single markdown element."""
+    return {"type": "context", "elements": [{"type": "mrkdwn", "text": text}]}
+
+
+def _section_block(text: str) -> SlackBlock:
+    """Build a section block with markdown text."""
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+# Static blocks are built once and shared; block dicts are never mutated
+# after they are built.
+_DIVIDER: SlackBlock = {"type": "divider"}
+_ALERT_HEADER = _header_block("Coupon mentions detected in AI Overviews")
+_WEEKLY_HEADER = _header_block("Weekly coupon mention report")
+_UNTRACKED_TITLE = _section_block("*Untracked coupons detected*")
+_VALID_TITLE = _section_block("*Valid coupon mentions*")
+_PERFORMANCE_TITLE = _section_block("*Coupon Performance (week over week)*")
+_CONTINUED = _context_block("_(continued)_")
 
 
 class SlackClient:
@@ -41,7 +70,39 @@ class SlackClient:
         """
         self._webhook_url = webhook_url
         self._default_channel = default_channel
-        self._client = AsyncWebhookClient(url=webhook_url)
+        self._session: aiohttp.ClientSession | None = None
+        self._client: AsyncWebhookClient | None = None
+
+    async def __aenter__(self) -> Self:
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Close the shared HTTP session on exit."""
+        await self.close()
+
+    def _get_client(self) -> AsyncWebhookClient:
+        """Return the webhook client, opening the shared session on first use.
+
+        Without an explicit session, AsyncWebhookClient opens and closes a
+        new aiohttp session (and TLS connection) for every send.
+        """
+        if self._client is None:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=_HTTP_TIMEOUT_SECONDS)
+            )
+            self._client = AsyncWebhookClient(
+                url=self._webhook_url,
+                session=self._session,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+        self._client = None
 
     async def send_message(
         self,
@@ -50,14 +111,47 @@ class SlackClient:
     ) -> bool:
         """Send a message to Slack.
 
+        Block lists longer than Slack's per-message limit are split across
+        consecutive messages, each follow-up opening with a "continued"
+        marker. Chunks are posted one after another so they appear in
+        order in the channel.
+
         Args:
             text: Fallback text for the message.
             blocks: Optional Block Kit blocks for rich formatting.
 
         Returns:
-            True if message was sent successfully.
+            True if every message was sent successfully.
         """
-        response = await self._client.send(
+        if not blocks or len(blocks) <= MAX_BLOCKS_PER_MESSAGE:
+            return await self._post(text, blocks)
+
+        for chunk in self._chunk_blocks(blocks):
+            if not await self._post(text, chunk):
+                return False
+        return True
+
+    @staticmethod
+    def _chunk_blocks(
+        blocks: list[Block] | list[dict],
+    ) -> Iterator[list[Block | dict]]:
+        """Split blocks into message-sized chunks.
+
+        Every chunk after the first starts with a continuation marker, so
+        it holds one content block fewer.
+        """
+        yield list(blocks[:MAX_BLOCKS_PER_MESSAGE])
+        step = MAX_BLOCKS_PER_MESSAGE - 1
+        for start in range(MAX_BLOCKS_PER_MESSAGE, len(blocks), step):
+            yield [_CONTINUED, *blocks[start : start + step]]
+
+    async def _post(
+        self,
+        text: str,
+        blocks: Sequence[Block | dict] | None,
+    ) -> bool:
+        """Post a single webhook message."""
+        response = await self._get_client().send(
             text=text,
             blocks=blocks,
         )
@@ -69,68 +163,80 @@ class SlackClient:
         last_seen: date | None,
     ) -> str:
         """Format a date range for display."""
-        if first_seen is None and last_seen is None:
-            return ""
-        if first_seen and last_seen:
-            if first_seen == last_seen:
-                return f"({first_seen})"
+        if first_seen and last_seen and first_seen != last_seen:
             return f"({first_seen} to {last_seen})"
-        if last_seen:
-            return f"({last_seen})"
-        if first_seen:
-            return f"({first_seen})"
-        return ""
+        seen = last_seen or first_seen
+        return f"({seen})" if seen else ""
 
     @staticmethod
-    def _format_coupon_match_block(match: CouponMatch) -> Block:
+    def _format_coupon_match_block(match: CouponMatch) -> SlackBlock:
         """Format a single coupon match as a Slack block."""
         location = match.location or "Global"
-        return SectionBlock(
-            text=MarkdownTextObject(
-                text=(
-                    f"*Keyword:* `{match.keyword}`\n"
-                    f"*Location:* {location}\n"
-                    f"*Product:* {match.product}\n"
-                    f"*Coupon:* `{match.coupon_code}`\n"
-                    f"*Date:* {match.scraped_date}\n"
-                    f"*Context:* _{match.match_context}_"
-                )
-            )
+        return _section_block(
+            f"*Keyword:* `{match.keyword}`\n"
+            f"*Location:* {location}\n"
+            f"*Product:* {match.product}\n"
+            f"*Coupon:* `{match.coupon_code}`\n"
+            f"*Date:* {match.scraped_date}\n"
+            f"*Context:* _{match.match_context}_"
         )
 
     @staticmethod
     def _group_rows_by_coupon(
         rows: list[WeeklyReportRow],
     ) -> list[tuple[str, list[WeeklyReportRow]]]:
-        """Group report rows by coupon code and sort A to Z."""
-        grouped: dict[str, list[WeeklyReportRow]] = defaultdict(list)
-        for row in rows:
-            if row.coupon_detected:
-                grouped[row.coupon_detected].append(row)
-        return sorted(grouped.items(), key=lambda item: item[0].casefold())
+        """Group report rows by coupon code and sort A to Z.
 
-    @staticmethod
-    def _format_coupon_group_text(
-        coupon_code: str,
-        rows: list[WeeklyReportRow],
-    ) -> str:
-        """Format grouped coupon rows for Slack display."""
+        Rows are sorted once by coupon, keyword and location, so each
+        group comes back already in display order.
+        """
         sorted_rows = sorted(
-            rows,
+            (row for row in rows if row.coupon_detected),
             key=lambda row: (
+                (row.coupon_detected or "").casefold(),
+                row.coupon_detected,
                 row.keyword.casefold(),
                 (row.location or "").casefold(),
             ),
         )
-        lines = [f"*`{coupon_code}`*"]
-        for row in sorted_rows:
-            location = row.location or "Global"
-            date_range = SlackClient._format_date_range(
-                row.first_seen, row.last_seen
+        return [
+            (code, list(grouped))
+            for code, grouped in groupby(
+                sorted_rows, key=attrgetter("coupon_detected")
             )
-            date_suffix = f" {date_range}" if date_range else ""
-            lines.append(f"• _{row.keyword}_ ({location}){date_suffix}")
-        return "\n".join(lines)
+        ]
+
+    @staticmethod
+    def _format_coupon_group_text(
+        coupon_code: str,
+        rows: list[WeeklyReportRow],
+    ) -> str:
+        """Format grouped coupon rows (already in display order)."""
+        format_line = SlackClient._format_coupon_row_line
+        return "\n".join(
+            [f"*`{coupon_code}`*", *(format_line(row) for row in rows)]
+        )
+
+    @staticmethod
+    def _format_coupon_row_line(row: WeeklyReportRow) -> str:
+        """Format one keyword/location bullet of a coupon group."""
+        location = row.location or "Global"
+        date_range = SlackClient._format_date_range(
+            row.first_seen, row.last_seen
+        )
+        date_suffix = f" {date_range}" if date_range else ""
+        return f"• _{row.keyword}_ ({location}){date_suffix}"
+
+    @staticmethod
+    def _coupon_group_blocks(
+        rows: list[WeeklyReportRow],
+    ) -> list[SlackBlock]:
+        """Build one section block per coupon group."""
+        format_text = SlackClient._format_coupon_group_text
+        return [
+            _section_block(format_text(code, grouped))
+            for code, grouped in SlackClient._group_rows_by_coupon(rows)
+        ]
 
     async def send_coupon_alert(
         self,
@@ -147,35 +253,22 @@ class SlackClient:
         if not matches:
             return True
 
-        blocks: list[Block] = [
-            HeaderBlock(
-                text=PlainTextObject(
-                    text="Coupon mentions detected in AI Overviews"
-                )
-            ),
-            ContextBlock(
-                elements=[
-                    MarkdownTextObject(
-                        text=f"Found {len(matches)} coupon mention(s)"
-                    )
-                ]
-            ),
-            DividerBlock(),
+        blocks: list[SlackBlock] = [
+            _ALERT_HEADER,
+            _context_block(f"Found {len(matches)} coupon mention(s)"),
+            _DIVIDER,
         ]
 
-        for match in matches[:MAX_DISPLAY_ITEMS]:
-            blocks.append(self._format_coupon_match_block(match))
-            blocks.append(DividerBlock())
+        format_match = self._format_coupon_match_block
+        blocks.extend(
+            block
+            for match in matches[:MAX_DISPLAY_ITEMS]
+            for block in (format_match(match), _DIVIDER)
+        )
 
         if len(matches) > MAX_DISPLAY_ITEMS:
             remaining = len(matches) - MAX_DISPLAY_ITEMS
-            blocks.append(
-                ContextBlock(
-                    elements=[
-                        MarkdownTextObject(text=f"_...and {remaining} more_")
-                    ]
-                )
-            )
+            blocks.append(_context_block(f"_...and {remaining} more_"))
 
         return await self.send_message(
             text=f"Found {len(matches)} coupon mentions in AI Overviews",
@@ -206,7 +299,7 @@ class SlackClient:
     @staticmethod
     def _format_performance_section(
         trends: dict[str, CouponPerformanceTrend],
-    ) -> list[Block]:
+    ) -> list[SlackBlock]:
         """Build Slack blocks for week-over-week performance.
 
         Args:
@@ -218,13 +311,9 @@ class SlackClient:
         if not trends:
             return []
 
-        blocks: list[Block] = [
-            DividerBlock(),
-            SectionBlock(
-                text=MarkdownTextObject(
-                    text="*Coupon Performance (week over week)*"
-                )
-            ),
+        blocks: list[SlackBlock] = [
+            _DIVIDER,
+            _PERFORMANCE_TITLE,
         ]
 
         sorted_trends = sorted(
@@ -233,12 +322,21 @@ class SlackClient:
             reverse=True,
         )
 
-        for trend in sorted_trends:
-            change_str = SlackClient._format_change(
-                trend.revenue_change,
-                trend.revenue_change_pct,
-            )
-            lines = [
+        blocks.extend(
+            _section_block(SlackClient._format_trend_text(trend))
+            for trend in sorted_trends
+        )
+        return blocks
+
+    @staticmethod
+    def _format_trend_text(trend: CouponPerformanceTrend) -> str:
+        """Format one coupon's week-over-week performance."""
+        change_str = SlackClient._format_change(
+            trend.revenue_change,
+            trend.revenue_change_pct,
+        )
+        return "\n".join(
+            [
                 f"*`{trend.coupon_code}`*",
                 (
                     f"• This week: "
@@ -252,15 +350,7 @@ class SlackClient:
                 ),
                 f"• Change: {change_str}",
             ]
-            blocks.append(
-                SectionBlock(
-                    text=MarkdownTextObject(
-                        text="\n".join(lines),
-                    )
-                )
-            )
-
-        return blocks
+        )
 
     def _build_weekly_report_blocks(
         self,
@@ -268,7 +358,7 @@ class SlackClient:
         start_date: date,
         end_date: date,
         coupon_trends: (dict[str, CouponPerformanceTrend] | None) = None,
-    ) -> list[Block]:
+    ) -> list[SlackBlock]:
         """Build Slack blocks for weekly report.
 
         Args:
@@ -280,80 +370,55 @@ class SlackClient:
         Returns:
             List of Slack Block Kit blocks.
         """
-        unique_keywords = {
-            (row.keyword, row.location)
-            for row in report_rows
-            if row.has_ai_overview
-        }
-        with_coupons = [row for row in report_rows if row.coupon_detected]
-        invalid_coupons = [
-            row for row in with_coupons if row.is_valid_coupon is False
-        ]
-
-        blocks: list[Block] = [
-            HeaderBlock(
-                text=PlainTextObject(text="Weekly coupon mention report")
+        unique_keywords: set[tuple[str, str | None]] = set()
+        coupon_mention_count = 0
+        invalid_coupons: list[WeeklyReportRow] = []
+        valid_coupons: list[WeeklyReportRow] = []
+        for row in report_rows:
+            if row.has_ai_overview:
+                unique_keywords.add((row.keyword, row.location))
+            if not row.coupon_detected:
+                continue
+            coupon_mention_count += 1
+            if row.is_valid_coupon is False:
+                invalid_coupons.append(row)
+            elif row.is_valid_coupon is True:
+                valid_coupons.append(row)
+
+        blocks: list[SlackBlock] = [
+            _WEEKLY_HEADER,
+            _context_block(f"Period: {start_date} to {end_date}"),
+            _DIVIDER,
+            _section_block(
+                f"*Summary*\n"
+                f"• Keywords analyzed: "
+                f"{len(unique_keywords)}\n"
+                f"• Coupon mentions found: "
+                f"{coupon_mention_count}"
             ),
-            ContextBlock(
-                elements=[
-                    MarkdownTextObject(
-                        text=(f"Period: {start_date} to {end_date}")
-                    )
-                ]
-            ),
-            DividerBlock(),
-            SectionBlock(
-                text=MarkdownTextObject(
-                    text=(
-                        f"*Summary*\n"
-                        f"• Keywords analyzed: "
-                        f"{len(unique_keywords)}\n"
-                        f"• Coupon mentions found: "
-                        f"{len(with_coupons)}"
-                    )
-                )
-            ),
-            DividerBlock(),
+            _DIVIDER,
         ]
 
         if invalid_coupons:
-            blocks.append(
-                SectionBlock(
-                    text=MarkdownTextObject(text="*Untracked coupons detected*")
-                )
-            )
-            for code, grouped in self._group_rows_by_coupon(invalid_coupons):
-                blocks.append(
-                    SectionBlock(
-                        text=MarkdownTextObject(
-                            text=self._format_coupon_group_text(code, grouped)
-                        )
-                    )
-                )
-
-        if with_coupons:
+            blocks.append(_UNTRACKED_TITLE)
+            blocks.extend(self._coupon_group_blocks(invalid_coupons))
+
+        if valid_coupons:
             if invalid_coupons:
-                blocks.append(DividerBlock())
-            blocks.append(
-                SectionBlock(
-                    text=MarkdownTextObject(text="*Valid coupon mentions*")
-                )
-            )
-            valid = [row for row in with_coupons if row.is_valid_coupon is True]
-            for code, grouped in self._group_rows_by_coupon(valid):
-                blocks.append(
-                    SectionBlock(
-                        text=MarkdownTextObject(
-                            text=self._format_coupon_group_text(code, grouped)
-                        )
-                    )
-                )
+                blocks.append(_DIVIDER)
+            blocks.append(_VALID_TITLE)
+            blocks.extend(self._coupon_group_blocks(valid_coupons))
 
         if coupon_trends:
             blocks.extend(self._format_performance_section(coupon_trends))
 
         return blocks
 
+    @staticmethod
+    def has_report_data(rows: list[WeeklyReportRow]) -> bool:
+        """Return True if any row has an AI Overview or a detected coupon."""
+        return any(row.has_ai_overview or row.coupon_detected for row in rows)
+
     async def send_weekly_report(
         self,
         rows: list[WeeklyReportRow],
@@ -363,6 +428,9 @@ class SlackClient:
     ) -> bool:
         """Send the weekly coupon mention report.
 
+        The report is posted as given; callers skip empty reports by
+        checking has_report_data first.
+
         Args:
             rows: Report data rows.
             start_date: Start of reporting period.
@@ -372,8 +440,14 @@ class SlackClient:
         Returns:
             True if report was sent successfully.
         """
-        blocks = self._build_weekly_report_blocks(
-            rows, start_date, end_date, coupon_trends
+        # Rendering is pure CPU; keep it off the event loop so other
+        # coroutines (DB writes, HTTP calls) progress meanwhile.
+        blocks = await asyncio.to_thread(
+            self._build_weekly_report_blocks,
+            rows,
+            start_date,
+            end_date,
+            coupon_trends,
         )
 
         return await self.send_message(
@@ -7,6 +7,40 @@ from pydantic import Field, computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache
+def _encode_database_url(url: str) -> str:
+    """URL-encode the user credentials of a database URL.
+
+    Cached on the URL string, so settings copies with a different URL are
+    encoded afresh while repeated reads of the same URL parse it once.
+    """
+    if "@" not in url:
+        return url
+
+    parts = urlsplit(url)
+    if parts.username is None and parts.password is None:
+        return url
+
+    username = quote(unquote(parts.username or ""), safe="")
+    password = quote(unquote(parts.password or ""), safe="")
+    if username == (parts.username or "") and password == (
+        parts.password or ""
+    ):
+        return url
+
+    hostname = parts.hostname or ""
+    if hostname and ":" in hostname and not hostname.startswith("["):
+        hostname = f"[{hostname}]"
+    port = f":{parts.port}" if parts.port is not None else ""
+    userinfo = username
+    if parts.password is not None:
+        userinfo = f"{username}:{password}"
+    netloc = f"{userinfo}@{hostname}{port}"
+    return urlunsplit(
+        (parts.scheme, netloc, parts.path, parts.query, parts.fragment)
+    )
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -14,6 +48,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     database_url: str = Field(
@@ -31,23 +66,24 @@ class Settings(BaseSettings):
     @property
     def database_url_str(self) -> str:
         """Return database URL with user credentials URL-encoded."""
-        parts = urlsplit(self.database_url)
-        if parts.username is None and parts.password is None:
-            return self.database_url
-
-        username = quote(unquote(parts.username or ""), safe="")
-        password = quote(unquote(parts.password or ""), safe="")
-        hostname = parts.hostname or ""
-        if hostname and ":" in hostname and not hostname.startswith("["):
-            hostname = f"[{hostname}]"
-        port = f":{parts.port}" if parts.port is not None else ""
-        userinfo = username
-        if parts.password is not None:
-            userinfo = f"{username}:{password}"
-        netloc = f"{userinfo}@{hostname}{port}"
-        return urlunsplit(
-            (parts.scheme, netloc, parts.path, parts.query, parts.fragment)
-        )
+        return _encode_database_url(self.database_url)
+
+    db_pool_min_size: int = Field(
+        default=1,
+        description="Minimum number of connections kept open in the pool",
+    )
+    db_pool_max_size: int = Field(
+        default=25,
+        description="Maximum number of connections in the pool",
+    )
+    db_pool_max_inactive_lifetime: float = Field(
+        default=300.0,
+        description="Seconds before an idle pooled connection is closed",
+    )
+    db_pool_max_queries: int = Field(
+        default=50000,
+        description="Queries served by a connection before it is recycled",
+    )
 
     slack_webhook_url: str = Field(
         ...,
@@ -1,16 +1,18 @@
 """Data models for coupon mentions and AI Overview tracking."""
 
-import json
 from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class AIOverviewPrompt(BaseModel):
     """Represents a tracked keyword/prompt in the AI Overview system."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     prompt_text: str
     primary_product: str
@@ -22,6 +24,8 @@ class AIOverviewPrompt(BaseModel):
 class AIOverviewResult(BaseModel):
     """Represents an AI Overview result containing response text."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     prompt_id: UUID
     provider: str
@@ -35,16 +39,17 @@ class AIOverviewResult(BaseModel):
     @field_validator("sources", mode="before")
     @classmethod
     def parse_sources(cls, value: Any) -> list[dict] | None:
-        """Parse sources from string if needed."""
-        if value is None:
-            return None
-        if isinstance(value, str):
+        """Parse sources from a JSON string or bytes if needed.
+
+        Anything that is not a JSON array becomes None, so the value fits
+        the field type even when the model is built with model_construct.
+        """
+        if isinstance(value, (str, bytes)):
             try:
-                parsed = json.loads(value)
-                return parsed if isinstance(parsed, list) else None
-            except (json.JSONDecodeError, TypeError):
+                value = orjson.loads(value)
+            except orjson.JSONDecodeError:
                 return None
-        return value
+        return value if isinstance(value, list) else None
 
 
 class CouponMatch(BaseModel):
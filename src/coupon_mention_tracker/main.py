@@ -16,6 +16,7 @@ from coupon_mention_tracker.core.models import (
     AIOverviewResult,
     CouponMatch,
     CouponPerformanceTrend,
+    WeeklyReportRow,
 )
 from coupon_mention_tracker.repositories.ai_overview import (
     AIOverviewRepository,
@@ -25,6 +26,44 @@ from coupon_mention_tracker.services.coupon_matcher import CouponMatcher
 from coupon_mention_tracker.services.report import WeeklyReportGenerator
 
 
+def _tracking_record(
+    prompt: AIOverviewPrompt,
+    result: AIOverviewResult,
+    coupon_match: CouponMatch | None,
+    valid_by_code: dict[str, bool],
+) -> dict:
+    """Build one Looker tracking record for a result and its first match."""
+    record = {
+        "keyword": prompt.prompt_text,
+        "location": prompt.location,
+        "primary_product": prompt.primary_product,
+        "has_ai_overview": True,
+        "ai_overview_result_id": result.id,
+        "scraped_date": result.scraped_date,
+    }
+    if coupon_match is None:
+        record.update(
+            tracked_coupon_present=False,
+            detected_coupon_code=None,
+            is_valid_coupon=None,
+            match_context=None,
+            source_mention_count=0,
+            source_urls_with_mentions=[],
+            source_mention_unavailable=False,
+        )
+    else:
+        record.update(
+            tracked_coupon_present=True,
+            detected_coupon_code=coupon_match.coupon_code,
+            is_valid_coupon=valid_by_code[coupon_match.coupon_code],
+            match_context=coupon_match.match_context,
+            source_mention_count=len(coupon_match.source_urls_with_mentions),
+            source_urls_with_mentions=coupon_match.source_urls_with_mentions,
+            source_mention_unavailable=coupon_match.source_mention_unavailable,
+        )
+    return record
+
+
 def build_tracking_records(
     results: list[tuple[AIOverviewPrompt, AIOverviewResult]],
     matches: list[CouponMatch],
@@ -42,58 +81,31 @@ def build_tracking_records(
     """
     match_index: dict[tuple, CouponMatch] = {}
     for coupon_match in matches:
-        match_key = (
-            coupon_match.keyword,
-            coupon_match.location,
-            coupon_match.scraped_date,
+        match_index.setdefault(
+            (
+                coupon_match.keyword,
+                coupon_match.location,
+                coupon_match.scraped_date,
+            ),
+            coupon_match,
         )
-        if match_key not in match_index:
-            match_index[match_key] = coupon_match
-
-    records = []
-    for prompt, result in results:
-        match_key = (prompt.prompt_text, prompt.location, result.scraped_date)
-        coupon_match = match_index.get(match_key)
-
-        records.append(
-            {
-                "keyword": prompt.prompt_text,
-                "location": prompt.location,
-                "primary_product": prompt.primary_product,
-                "has_ai_overview": True,
-                "ai_overview_result_id": result.id,
-                "tracked_coupon_present": coupon_match is not None,
-                "detected_coupon_code": (
-                    coupon_match.coupon_code if coupon_match else None
-                ),
-                "is_valid_coupon": (
-                    matcher.is_valid_coupon(coupon_match.coupon_code)
-                    if coupon_match
-                    else None
-                ),
-                "match_context": (
-                    coupon_match.match_context if coupon_match else None
-                ),
-                "scraped_date": result.scraped_date,
-                "source_mention_count": (
-                    len(coupon_match.source_urls_with_mentions)
-                    if coupon_match
-                    else 0
-                ),
-                "source_urls_with_mentions": (
-                    coupon_match.source_urls_with_mentions
-                    if coupon_match
-                    else []
-                ),
-                "source_mention_unavailable": (
-                    coupon_match.source_mention_unavailable
-                    if coupon_match
-                    else False
-                ),
-            }
+    # Only a handful of distinct codes appear; validate each once.
+    valid_by_code = {
+        code: matcher.is_valid_coupon(code)
+        for code in {m.coupon_code for m in match_index.values()}
+    }
+
+    return [
+        _tracking_record(
+            prompt,
+            result,
+            match_index.get(
+                (prompt.prompt_text, prompt.location, result.scraped_date)
+            ),
+            valid_by_code,
         )
-
-    return records
+        for prompt, result in results
+    ]
 
 
 def fetch_coupons_from_google_sheets(settings: Settings) -> list[str]:
@@ -161,21 +173,146 @@ async def _fetch_coupon_trends(
         await client.close()
 
 
-async def run_weekly_report(days: int = 7, send_slack: bool = True) -> int:
+def _log_report_summary(
+    rows: list[WeeklyReportRow],
+    matches: list[CouponMatch],
+) -> None:
+    """Log report totals and any invalid/outdated coupons.
+
+    Args:
+        rows: Weekly report rows.
+        matches: Coupon matches found during analysis.
+    """
+    unique_keywords: set[tuple[str, str | None]] = set()
+    keywords_with_overview: set[tuple[str, str | None]] = set()
+    invalid_coupons: list[WeeklyReportRow] = []
+    for row in rows:
+        keyword_key = (row.keyword, row.location)
+        unique_keywords.add(keyword_key)
+        if row.has_ai_overview:
+            keywords_with_overview.add(keyword_key)
+        if row.coupon_detected and row.is_valid_coupon is False:
+            invalid_coupons.append(row)
+
+    logger.info(
+        "[REPORT] Report generated: {} keywords, {} with AI Overview, "
+        "{} matches",
+        len(unique_keywords),
+        len(keywords_with_overview),
+        len(matches),
+    )
+
+    if invalid_coupons:
+        logger.warning(
+            "[REPORT] Found {} invalid/outdated coupons in AI Overviews",
+            len(invalid_coupons),
+        )
+        for row in invalid_coupons:
+            logger.warning(
+                "[REPORT]  - {} in '{}' ({})",
+                row.coupon_detected,
+                row.keyword,
+                row.location or "Global",
+            )
+
+
+async def _send_slack_report(
+    notifier: SlackClient,
+    rows: list[WeeklyReportRow],
+    start_date: date,
+    end_date: date,
+    coupon_trends: dict[str, CouponPerformanceTrend] | None,
+) -> bool:
+    """Send the weekly report to Slack.
+
+    Returns:
+        True if the report was sent successfully or skipped as empty.
+    """
+    if not notifier.has_report_data(rows):
+        logger.info("[SLACK] Weekly report has no data, skipped Slack send")
+        return True
+
+    logger.info("[SLACK] Sending report to Slack...")
+    try:
+        success = await notifier.send_weekly_report(
+            rows=rows,
+            start_date=start_date,
+            end_date=end_date,
+            coupon_trends=coupon_trends,
+        )
+    except Exception:
+        logger.exception("[SLACK] Error in send_weekly_report")
+        return False
+
+    if success:
+        logger.info("[SLACK] Report sent to Slack successfully")
+    else:
+        logger.error(
+            "[SLACK] Error in send_weekly_report: "
+            "Failed to send report to Slack"
+        )
+    return success
+
+
+async def _save_tracking_records(tracking_records: list[dict]) -> bool:
+    """Save tracking records to the Looker schema.
+
+    Returns:
+        True if the records were saved (or there was nothing to save).
+    """
+    logger.info("[LOOKER] Saving tracking data to Looker schema...")
+    if not tracking_records:
+        return True
+
+    try:
+        saved_count = await LookerRepository().save_tracking_batch(
+            tracking_records
+        )
+    except Exception:
+        logger.exception("[LOOKER] Failed to save tracking records")
+        return False
+
+    logger.info("[LOOKER] Saved {} tracking records to Looker", saved_count)
+    return True
+
+
+async def run_weekly_report(
+    days: int = 7,
+    send_slack: bool = True,
+    settings: Settings | None = None,
+) -> int:
     """Run the weekly coupon mention report.
 
     Args:
         days: Number of days to look back.
         send_slack: Whether to send the report to Slack.
+        settings: Application settings; loaded via get_settings() if omitted.
 
     Returns:
         Exit code (0 for success, 1 for failure).
     """
-    settings = get_settings()
+    if settings is None:
+        settings = get_settings()
     repository: AIOverviewRepository | None = None
+    notifier = SlackClient(
+        webhook_url=settings.slack_webhook_url,
+        default_channel=settings.slack_channel,
+    )
 
     try:
-        coupons = fetch_coupons_from_google_sheets(settings)
+        repository = AIOverviewRepository(settings)
+
+        # The Sheets client is synchronous; run it in a worker thread so
+        # the coupon fetch overlaps with opening the database pool. The
+        # task group cancels and awaits the pool connect if the fetch
+        # fails, so the finally block never races a half-open pool.
+        logger.info("[DATABASE] Connecting to database...")
+        async with asyncio.TaskGroup() as tg:
+            coupons_task = tg.create_task(
+                asyncio.to_thread(fetch_coupons_from_google_sheets, settings)
+            )
+            tg.create_task(repository.connect())
+        coupons = coupons_task.result()
         logger.info("[GOOGLE_SHEETS] Tracking {} coupon codes", len(coupons))
         if not coupons:
             logger.warning(
@@ -183,17 +320,9 @@ async def run_weekly_report(days: int = 7, send_slack: bool = True) -> int:
                 "matcher will never match"
             )
 
-        repository = AIOverviewRepository(settings)
         matcher = CouponMatcher(coupons)
-        notifier = SlackClient(
-            webhook_url=settings.slack_webhook_url,
-            default_channel=settings.slack_channel,
-        )
         generator = WeeklyReportGenerator(repository, matcher, notifier)
 
-        logger.info("[DATABASE] Connecting to database...")
-        await repository.connect()
-
         tags_filter = ["Affiliates"]
         logger.info(
             "[REPORT] Generating coupon mention report for last {} days "
@@ -201,77 +330,30 @@ async def run_weekly_report(days: int = 7, send_slack: bool = True) -> int:
             days,
             tags_filter,
         )
-        rows, matches = await generator.generate_report(
-            days=days, tags=tags_filter
-        )
-
-        raw_results = await repository.get_results_last_n_days(
+        rows, matches, raw_results = await generator.generate_report(
             days=days, tags=tags_filter
         )
 
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
 
-        unique_keywords = {(row.keyword, row.location) for row in rows}
-        keywords_with_overview = {
-            (row.keyword, row.location) for row in rows if row.has_ai_overview
-        }
-        logger.info(
-            "[REPORT] Report generated: {} keywords, {} with AI Overview, "
-            "{} matches",
-            len(unique_keywords),
-            len(keywords_with_overview),
-            len(matches),
-        )
-
-        with_coupons = [row for row in rows if row.coupon_detected]
-        invalid_coupons = [
-            row for row in with_coupons if row.is_valid_coupon is False
-        ]
-
-        if invalid_coupons:
-            logger.warning(
-                "[REPORT] Found {} invalid/outdated coupons in AI Overviews",
-                len(invalid_coupons),
-            )
-            for row in invalid_coupons:
-                logger.warning(
-                    "[REPORT]  - {} in '{}' ({})",
-                    row.coupon_detected,
-                    row.keyword,
-                    row.location or "Global",
-                )
+        _log_report_summary(rows, matches)
 
         coupon_trends = await _fetch_coupon_trends(settings, rows)
 
+        tracking_records = build_tracking_records(raw_results, matches, matcher)
+
+        # Slack (HTTP) and Looker (PostgreSQL) writes are independent, so
+        # they run concurrently.
+        writes = [_save_tracking_records(tracking_records)]
         if send_slack:
-            logger.info("[SLACK] Sending report to Slack...")
-            success = await notifier.send_weekly_report(
-                rows=rows,
-                start_date=start_date,
-                end_date=end_date,
-                coupon_trends=coupon_trends,
-            )
-            if success:
-                logger.info("[SLACK] Report sent to Slack successfully")
-            else:
-                logger.error(
-                    "[SLACK] Error in send_weekly_report: "
-                    "Failed to send report to Slack"
+            writes.append(
+                _send_slack_report(
+                    notifier, rows, start_date, end_date, coupon_trends
                 )
-                return 1
-
-        logger.info("[LOOKER] Saving tracking data to Looker schema...")
-        tracking_records = build_tracking_records(raw_results, matches, matcher)
-        if tracking_records:
-            looker_repo = LookerRepository()
-            saved_count = await looker_repo.save_tracking_batch(
-                tracking_records
-            )
-            logger.info(
-                "[LOOKER] Saved {} tracking records to Looker",
-                saved_count,
             )
+        if not all(await asyncio.gather(*writes)):
+            return 1
 
         logger.info("[MAIN] Job completed successfully")
         return 0
@@ -281,6 +363,7 @@ async def run_weekly_report(days: int = 7, send_slack: bool = True) -> int:
         return 1
 
     finally:
+        await notifier.close()
         if repository is not None:
             await repository.disconnect()
 
@@ -294,7 +377,9 @@ def main() -> None:
 
     logger.info("[MAIN] Starting Coupon Mention Tracker job")
 
-    exit_code = asyncio.run(run_weekly_report(days=days, send_slack=True))
+    exit_code = asyncio.run(
+        run_weekly_report(days=days, send_slack=True, settings=settings)
+    )
     sys.exit(exit_code)
 
 
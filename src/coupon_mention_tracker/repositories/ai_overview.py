@@ -119,8 +119,10 @@ class AIOverviewRepository:
         async with DatabasePool.acquire() as conn:
             rows = await conn.fetch(final_query, *params)
 
+        # asyncpg already returns typed values, so rows are mapped onto
+        # models without re-validation, as in get_results_for_period.
         return [
-            AIOverviewPrompt(
+            AIOverviewPrompt.model_construct(
                 id=row["id"],
                 prompt_text=row["prompt_text"],
                 primary_product=row["primary_product"],
@@ -162,24 +164,32 @@ class AIOverviewRepository:
         async with DatabasePool.acquire() as conn:
             rows = await conn.fetch(final_query, *params)
 
+        # asyncpg already returns typed values (UUID, date, decoded jsonb),
+        # so models are built without re-validation, and each prompt is
+        # built once and shared by all of its results. Sources still go
+        # through parse_sources, which drops non-array jsonb payloads.
+        prompts: dict[UUID, AIOverviewPrompt] = {}
         results = []
         for row in rows:
-            prompt = AIOverviewPrompt(
-                id=row["prompt_id"],
-                prompt_text=row["prompt_text"],
-                primary_product=row["primary_product"],
-                location=row["location"],
-                status=row["status"],
-                created_at=row["prompt_created_at"],
-            )
-            result = AIOverviewResult(
+            prompt_id = row["prompt_id"]
+            prompt = prompts.get(prompt_id)
+            if prompt is None:
+                prompt = prompts[prompt_id] = AIOverviewPrompt.model_construct(
+                    id=prompt_id,
+                    prompt_text=row["prompt_text"],
+                    primary_product=row["primary_product"],
+                    location=row["location"],
+                    status=row["status"],
+                    created_at=row["prompt_created_at"],
+                )
+            result = AIOverviewResult.model_construct(
                 id=row["result_id"],
-                prompt_id=row["prompt_id"],
+                prompt_id=prompt_id,
                 provider=row["provider"],
                 scraped_date=row["scraped_date"],
                 scraped_at=row["scraped_at"],
                 response_text=row["response_text"],
-                sources=row["sources"],
+                sources=AIOverviewResult.parse_sources(row["sources"]),
                 ahrefs_volume=row["ahrefs_volume"],
                 sentiment_label=row["sentiment_label"],
             )
@@ -232,11 +242,7 @@ class AIOverviewRepository:
 
         sources_by_result: dict[str, list[dict]] = {}
         for row in rows:
-            result_id = str(row["result_id"])
-            if result_id not in sources_by_result:
-                sources_by_result[result_id] = []
-
-            sources_by_result[result_id].append(
+            sources_by_result.setdefault(str(row["result_id"]), []).append(
                 {
                     "id": row["id"],
                     "source_url": row["source_url"],
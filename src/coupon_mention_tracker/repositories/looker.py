@@ -76,6 +76,9 @@ class LookerRepository:
     ) -> int:
         """Save multiple tracking records in a batch.
 
+        Records are streamed into a temporary staging table with COPY and
+        upserted from there in a single statement.
+
         Args:
             records: List of dicts with tracking data. Each dict should have:
                 - keyword (str, required)
@@ -117,8 +120,21 @@ class LookerRepository:
             for r in records
         ]
 
-        async with DatabasePool.acquire() as conn:
-            await conn.executemany(sql_queries.UPSERT_TRACKING_HISTORY, params)
+        # Later records win, as they would with row-by-row upserts. NULL
+        # locations never conflict on the unique key, so they are all kept.
+        latest: dict[object, tuple] = {}
+        for index, row in enumerate(params):
+            key = (row[0], row[1], row[9]) if row[1] is not None else index
+            latest[key] = row
+
+        async with DatabasePool.acquire() as conn, conn.transaction():
+            await conn.execute(sql_queries.CREATE_TRACKING_STAGING_TABLE)
+            await conn.copy_records_to_table(
+                sql_queries.TRACKING_STAGING_TABLE,
+                records=list(latest.values()),
+                columns=sql_queries.TRACKING_HISTORY_COLUMNS,
+            )
+            await conn.execute(sql_queries.UPSERT_TRACKING_HISTORY_FROM_STAGING)
 
         logger.info(
             "[LOOKER] Saved {} tracking records to looker schema", len(records)
@@ -50,13 +50,31 @@ GET_SOURCES_FOR_RESULTS = """
     JOIN marketing_hub.ai_overviews_sources s
         ON s.source_url = SPLIT_PART(source_item->>'url', '#', 1)
     WHERE r.id = ANY($1::uuid[])
+      AND jsonb_typeof(r.sources) = 'array'
+      AND r.sources <> '[]'::jsonb
       AND s.source_html_content IS NOT NULL
       AND s.scrape_status = 'success'
     ORDER BY source_item->>'url', r.id, s.scraped_at DESC
 """
 
+TRACKING_HISTORY_COLUMNS = (
+    "keyword",
+    "location",
+    "primary_product",
+    "has_ai_overview",
+    "ai_overview_result_id",
+    "tracked_coupon_present",
+    "detected_coupon_code",
+    "is_valid_coupon",
+    "match_context",
+    "scraped_date",
+    "source_mention_count",
+    "source_urls_with_mentions",
+    "source_mention_unavailable",
+)
+
 UPSERT_TRACKING_HISTORY = """
-    INSERT INTO looker.coupon_tracking_history
+    INSERT INTO looker.coupon_tracking_history AS h
     (
         keyword,
         location,
@@ -98,4 +116,114 @@ UPSERT_TRACKING_HISTORY = """
         source_mention_count = EXCLUDED.source_mention_count,
         source_urls_with_mentions = EXCLUDED.source_urls_with_mentions,
         source_mention_unavailable = EXCLUDED.source_mention_unavailable
+    WHERE (
+        h.has_ai_overview,
+        h.ai_overview_result_id,
+        h.tracked_coupon_present,
+        h.detected_coupon_code,
+        h.is_valid_coupon,
+        h.match_context,
+        h.source_mention_count,
+        h.source_urls_with_mentions,
+        h.source_mention_unavailable
+    ) IS DISTINCT FROM (
+        EXCLUDED.has_ai_overview,
+        EXCLUDED.ai_overview_result_id,
+        EXCLUDED.tracked_coupon_present,
+        EXCLUDED.detected_coupon_code,
+        EXCLUDED.is_valid_coupon,
+        EXCLUDED.match_context,
+        EXCLUDED.source_mention_count,
+        EXCLUDED.source_urls_with_mentions,
+        EXCLUDED.source_mention_unavailable
+    )
+"""
+
+TRACKING_STAGING_TABLE = "coupon_tracking_staging"
+
+CREATE_TRACKING_STAGING_TABLE = """
+    CREATE TEMP TABLE coupon_tracking_staging
+    ON COMMIT DROP
+    AS SELECT
+        keyword,
+        location,
+        primary_product,
+        has_ai_overview,
+        ai_overview_result_id,
+        tracked_coupon_present,
+        detected_coupon_code,
+        is_valid_coupon,
+        match_context,
+        scraped_date,
+        source_mention_count,
+        source_urls_with_mentions,
+        source_mention_unavailable
+    FROM looker.coupon_tracking_history
+    WITH NO DATA
+"""
+
+UPSERT_TRACKING_HISTORY_FROM_STAGING = """
+    INSERT INTO looker.coupon_tracking_history AS h
+    (
+        keyword,
+        location,
+        primary_product,
+        has_ai_overview,
+        ai_overview_result_id,
+        tracked_coupon_present,
+        detected_coupon_code,
+        is_valid_coupon,
+        match_context,
+        scraped_date,
+        source_mention_count,
+        source_urls_with_mentions,
+        source_mention_unavailable
+    )
+    SELECT
+        keyword,
+        location,
+        primary_product,
+        has_ai_overview,
+        ai_overview_result_id,
+        tracked_coupon_present,
+        detected_coupon_code,
+        is_valid_coupon,
+        match_context,
+        scraped_date,
+        source_mention_count,
+        source_urls_with_mentions,
+        source_mention_unavailable
+    FROM coupon_tracking_staging
+    ON CONFLICT (keyword, location, scraped_date)
+    DO UPDATE SET
+        has_ai_overview = EXCLUDED.has_ai_overview,
+        ai_overview_result_id = EXCLUDED.ai_overview_result_id,
+        tracked_coupon_present = EXCLUDED.tracked_coupon_present,
+        detected_coupon_code = EXCLUDED.detected_coupon_code,
+        is_valid_coupon = EXCLUDED.is_valid_coupon,
+        match_context = EXCLUDED.match_context,
+        source_mention_count = EXCLUDED.source_mention_count,
+        source_urls_with_mentions = EXCLUDED.source_urls_with_mentions,
+        source_mention_unavailable = EXCLUDED.source_mention_unavailable
+    WHERE (
+        h.has_ai_overview,
+        h.ai_overview_result_id,
+        h.tracked_coupon_present,
+        h.detected_coupon_code,
+        h.is_valid_coupon,
+        h.match_context,
+        h.source_mention_count,
+        h.source_urls_with_mentions,
+        h.source_mention_unavailable
+    ) IS DISTINCT FROM (
+        EXCLUDED.has_ai_overview,
+        EXCLUDED.ai_overview_result_id,
+        EXCLUDED.tracked_coupon_present,
+        EXCLUDED.detected_coupon_code,
+        EXCLUDED.is_valid_coupon,
+        EXCLUDED.match_context,
+        EXCLUDED.source_mention_count,
+        EXCLUDED.source_urls_with_mentions,
+        EXCLUDED.source_mention_unavailable
+    )
 """
@@ -35,6 +35,7 @@ class CouponMatcher:
             context_chars: Number of characters to include around match.
         """
         self._coupons = [c.strip().upper() for c in coupons if c.strip()]
+        self._coupon_set = frozenset(self._coupons)
         self._context_chars = context_chars
         self._patterns = self._build_patterns()
 
@@ -225,4 +226,4 @@ class CouponMatcher:
         Returns:
             True if coupon is tracked, False otherwise.
         """
-        return code.upper() in self._coupons
+        return code.upper() in self._coupon_set
@@ -54,7 +54,11 @@ class WeeklyReportGenerator:
         self,
         days: int = 7,
         tags: list[str] | None = None,
-    ) -> tuple[list[WeeklyReportRow], list[CouponMatch]]:
+    ) -> tuple[
+        list[WeeklyReportRow],
+        list[CouponMatch],
+        list[tuple[AIOverviewPrompt, AIOverviewResult]],
+    ]:
         """Generate weekly report data.
 
         Args:
@@ -62,7 +66,8 @@ class WeeklyReportGenerator:
             tags: Filter by tags (e.g., ['Dominykas']).
 
         Returns:
-            Tuple of (report rows, all coupon matches found).
+            Tuple of (report rows, all coupon matches found, the raw
+            (prompt, result) pairs the report was built from).
         """
         results = await self._repository.get_results_last_n_days(
             days=days, tags=tags
@@ -157,7 +162,7 @@ class WeeklyReportGenerator:
             )
         )
 
-        return rows, all_matches
+        return rows, all_matches, results
 
     async def run_and_send(
         self, days: int = 7, tags: list[str] | None = None
@@ -169,9 +174,12 @@ class WeeklyReportGenerator:
             tags: Filter by tags (e.g., ['Dominykas']).
 
         Returns:
-            True if report was sent successfully.
+            True if report was sent successfully, or if there was nothing
+            to report.
         """
-        rows, _ = await self.generate_report(days=days, tags=tags)
+        rows, _, _ = await self.generate_report(days=days, tags=tags)
+        if not self._notifier.has_report_data(rows):
+            return True
 
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
@@ -6,6 +6,7 @@ from types import SimpleNamespace
 
 import pytest
 
+from coupon_mention_tracker.clients import google_sheets
 from coupon_mention_tracker.clients.google_sheets import GoogleSheetsClient
 
 
@@ -17,13 +18,28 @@ def _make_client_with_service(service) -> GoogleSheetsClient:
     return client
 
 
-def test_column_index_to_letter() -> None:
-    client = object.__new__(GoogleSheetsClient)
+def test_build_service_is_reused_for_same_credentials(monkeypatch) -> None:
+    builds = []
+
+    def _build(*args, **kwargs):
+        builds.append((args, kwargs))
+        return object()
+
+    monkeypatch.setattr(google_sheets, "build", _build)
+    monkeypatch.setattr(
+        google_sheets.service_account.Credentials,
+        "from_service_account_info",
+        lambda info, scopes: (info, scopes),
+    )
+    google_sheets._build_sheets_service.cache_clear()
+
+    first = GoogleSheetsClient("sheet-a", '{"type": "service_account"}')
+    second = GoogleSheetsClient("sheet-b", '{"type": "service_account"}')
+    google_sheets._build_sheets_service.cache_clear()
 
-    assert client._column_index_to_letter(0) == "A"
-    assert client._column_index_to_letter(25) == "Z"
-    assert client._column_index_to_letter(26) == "AA"
-    assert client._column_index_to_letter(27) == "AB"
+    assert first._service is second._service
+    assert len(builds) == 1
+    assert builds[0][1]["cache_discovery"] is False
 
 
 def test_get_sheet_title_by_gid_found() -> None:
@@ -40,24 +56,10 @@ def test_get_sheet_title_by_gid_found() -> None:
 
 
 def test_get_column_index_by_name_found_and_missing() -> None:
-    class _Svc:
-        def spreadsheets(self):
-            return self
-
-        def values(self):
-            return self
-
-        def get(self, spreadsheetId, range):
-            self._last = (spreadsheetId, range)
-            return self
-
-        def execute(self):
-            return {"values": [["A", "Coupon", "C"]]}
-
-    client = _make_client_with_service(_Svc())
+    headers = ["A", "Coupon", "C"]
 
-    assert client._get_column_index_by_name("Sheet1", "Coupon") == 1
-    assert client._get_column_index_by_name("Sheet1", "Missing") is None
+    assert GoogleSheetsClient._get_column_index_by_name(headers, "Coupon") == 1
+    assert GoogleSheetsClient._get_column_index_by_name(headers, "Nope") is None
 
 
 def test_get_column_values_by_gid_and_name_success_strips_and_skips_empty() -> (
@@ -77,9 +79,16 @@ def test_get_column_values_by_gid_and_name_success_strips_and_skips_empty() -> (
             return self
 
         def execute(self):
-            if calls[-1][1].endswith("!1:1"):
-                return {"values": [["A", "Coupon"]]}
-            return {"values": [["  SAVE10  "], [""], ["  "], ["NEW20"]]}
+            return {
+                "values": [
+                    ["A", "Coupon"],
+                    ["x", "  SAVE10  "],
+                    ["x", ""],
+                    ["x"],
+                    ["x", "  "],
+                    ["x", "NEW20"],
+                ]
+            }
 
     client = _make_client_with_service(_Svc())
     client._sheet_metadata = {
@@ -93,6 +102,7 @@ def test_get_column_values_by_gid_and_name_success_strips_and_skips_empty() -> (
     )
 
     assert values == ["SAVE10", "NEW20"]
+    assert calls == [("sheet", "'Sheet1'")]
 
 
 def test_get_column_values_by_gid_and_name_raises_when_sheet_missing() -> None:
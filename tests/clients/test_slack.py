@@ -7,10 +7,17 @@ from http import HTTPStatus
 from uuid import uuid4
 
 import pytest
-from slack_sdk.models.blocks import HeaderBlock, SectionBlock
 
-from coupon_mention_tracker.clients.slack import MAX_DISPLAY_ITEMS, SlackClient
-from coupon_mention_tracker.core.models import CouponMatch, WeeklyReportRow
+from coupon_mention_tracker.clients.slack import (
+    MAX_BLOCKS_PER_MESSAGE,
+    MAX_DISPLAY_ITEMS,
+    SlackClient,
+)
+from coupon_mention_tracker.core.models import (
+    CouponMatch,
+    CouponPerformanceTrend,
+    WeeklyReportRow,
+)
 
 
 @pytest.mark.asyncio
@@ -23,8 +30,9 @@ async def test_send_message_posts_payload(monkeypatch) -> None:
             self.body = body
 
     class _MockClient:
-        def __init__(self, url: str) -> None:
+        def __init__(self, url: str, session=None) -> None:
             self.url = url
+            self.session = session
 
         async def send(self, text, blocks=None):
             calls.append((self.url, text, blocks))
@@ -35,14 +43,46 @@ async def test_send_message_posts_payload(monkeypatch) -> None:
         _MockClient,
     )
 
-    notifier = SlackClient(webhook_url="https://example.invalid")
-    ok = await notifier.send_message("hello", blocks=[{"type": "divider"}])
+    async with SlackClient(webhook_url="https://example.invalid") as notifier:
+        ok = await notifier.send_message("hello", blocks=[{"type": "divider"}])
+        client = notifier._client
+        await notifier.send_message("again")
+
+        assert notifier._client is client
+        assert client is not None
+        assert client.session is not None
 
     assert ok is True
-    assert calls
+    assert len(calls) == 2
     assert calls[0][0] == "https://example.invalid"
     assert calls[0][1] == "hello"
     assert calls[0][2] == [{"type": "divider"}]
+    assert client.session.closed
+    assert notifier._client is None
+
+
+@pytest.mark.asyncio
+async def test_send_message_splits_oversized_block_lists(monkeypatch) -> None:
+    posted = []
+
+    async def _post(text, blocks):
+        posted.append((text, blocks))
+        return True
+
+    notifier = SlackClient(webhook_url="https://example.invalid")
+    monkeypatch.setattr(notifier, "_post", _post)
+
+    blocks = [
+        {"type": "divider", "n": i} for i in range(MAX_BLOCKS_PER_MESSAGE + 5)
+    ]
+    ok = await notifier.send_message("report", blocks=blocks)
+
+    assert ok is True
+    assert [len(chunk) for _, chunk in posted] == [MAX_BLOCKS_PER_MESSAGE, 6]
+    first, second = (chunk for _, chunk in posted)
+    assert second[0]["type"] == "context"
+    assert "continued" in second[0]["elements"][0]["text"]
+    assert [*first, *second[1:]] == blocks
 
 
 def test_format_coupon_match_block_defaults_location_global() -> None:
@@ -58,9 +98,9 @@ def test_format_coupon_match_block_defaults_location_global() -> None:
     )
 
     block = notifier._format_coupon_match_block(match)
-    assert isinstance(block, SectionBlock)
-    assert block.text is not None
-    assert "Global" in block.text.text
+    assert block["type"] == "section"
+    assert block["text"]["type"] == "mrkdwn"
+    assert "Global" in block["text"]["text"]
 
 
 @pytest.mark.asyncio
@@ -100,13 +140,68 @@ async def test_send_coupon_alert_truncates_and_adds_remaining(
 
     assert ok is True
     assert "Found" in captured["text"]
-    # Inspect block objects
+    # Inspect block dicts
     assert any(
-        b.type == "context" and b.elements and "...and" in b.elements[0].text
+        b["type"] == "context" and "...and" in b["elements"][0]["text"]
         for b in captured["blocks"]
     )
 
 
+def test_has_report_data_requires_overview_or_coupon() -> None:
+    def _row(has_ai_overview: bool, coupon: str | None) -> WeeklyReportRow:
+        return WeeklyReportRow(
+            keyword="k",
+            location=None,
+            product="p",
+            has_ai_overview=has_ai_overview,
+            coupon_detected=coupon,
+            is_valid_coupon=None,
+            first_seen=None,
+            last_seen=None,
+        )
+
+    assert SlackClient.has_report_data([]) is False
+    assert SlackClient.has_report_data([_row(False, None)]) is False
+    assert SlackClient.has_report_data([_row(True, None)]) is True
+    assert SlackClient.has_report_data([_row(False, "SAVE10")]) is True
+
+
+@pytest.mark.asyncio
+async def test_send_weekly_report_sends_rendered_blocks(monkeypatch) -> None:
+    captured = {}
+
+    async def _send_message(text, blocks=None):
+        captured["text"] = text
+        captured["blocks"] = blocks
+        return True
+
+    notifier = SlackClient(webhook_url="https://example.invalid")
+    monkeypatch.setattr(notifier, "send_message", _send_message)
+
+    rows = [
+        WeeklyReportRow(
+            keyword="k1",
+            location="US",
+            product="p",
+            has_ai_overview=True,
+            coupon_detected="SAVE10",
+            is_valid_coupon=True,
+            first_seen=date(2026, 1, 1),
+            last_seen=date(2026, 1, 2),
+        )
+    ]
+
+    ok = await notifier.send_weekly_report(
+        rows=rows,
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 8),
+    )
+
+    assert ok is True
+    assert captured["text"] == "Weekly coupon report: 2026-01-01 to 2026-01-08"
+    assert captured["blocks"][0]["type"] == "header"
+
+
 def test_build_weekly_report_blocks_includes_summary_and_invalid() -> None:
     notifier = SlackClient(webhook_url="https://example.invalid")
     rows = [
@@ -140,11 +235,106 @@ def test_build_weekly_report_blocks_includes_summary_and_invalid() -> None:
         end_date=date(2026, 1, 8),
     )
 
-    # Extract text from SectionBlocks and HeaderBlocks
+    # Extract text from section and header blocks
     lines = []
     for block in blocks:
-        if isinstance(block, (SectionBlock, HeaderBlock)) and block.text:
-            lines.append(block.text.text)
+        if block["type"] in {"section", "header"}:
+            lines.append(block["text"]["text"])
     text_blob = "\n".join(lines)
     assert "Untracked coupons detected" in text_blob
     assert "OLD10" in text_blob
+    assert "Keywords analyzed: 2" in text_blob
+    assert "Coupon mentions found: 2" in text_blob
+    assert "Valid coupon mentions" in text_blob
+
+
+def test_build_weekly_report_blocks_skips_empty_valid_section() -> None:
+    notifier = SlackClient(webhook_url="https://example.invalid")
+    rows = [
+        WeeklyReportRow(
+            keyword="k1",
+            location=None,
+            product="p",
+            has_ai_overview=True,
+            coupon_detected="OLD10",
+            is_valid_coupon=False,
+            first_seen=date(2026, 1, 1),
+            last_seen=date(2026, 1, 1),
+        ),
+    ]
+
+    blocks = notifier._build_weekly_report_blocks(
+        report_rows=rows,
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 8),
+    )
+
+    texts = [b["text"]["text"] for b in blocks if b["type"] == "section"]
+    assert "*Untracked coupons detected*" in texts
+    assert "*Valid coupon mentions*" not in texts
+    assert blocks[-1]["type"] != "divider"
+
+
+@pytest.mark.parametrize(
+    ("first_seen", "last_seen", "expected"),
+    [
+        (None, None, ""),
+        (date(2026, 1, 1), None, "(2026-01-01)"),
+        (None, date(2026, 1, 2), "(2026-01-02)"),
+        (date(2026, 1, 1), date(2026, 1, 1), "(2026-01-01)"),
+        (date(2026, 1, 1), date(2026, 1, 2), "(2026-01-01 to 2026-01-02)"),
+    ],
+)
+def test_format_date_range(first_seen, last_seen, expected) -> None:
+    assert SlackClient._format_date_range(first_seen, last_seen) == expected
+
+
+def test_group_rows_by_coupon_sorts_groups_and_rows() -> None:
+    def _row(keyword, location, coupon):
+        return WeeklyReportRow(
+            keyword=keyword,
+            location=location,
+            product="p",
+            has_ai_overview=True,
+            coupon_detected=coupon,
+            is_valid_coupon=True,
+            first_seen=None,
+            last_seen=None,
+        )
+
+    rows = [
+        _row("zeta", "US", "save10"),
+        _row("Alpha", "UK", "SAVE10"),
+        _row("beta", None, "ABC"),
+        _row("alpha", "DE", "SAVE10"),
+        _row("none", None, None),
+    ]
+
+    grouped = SlackClient._group_rows_by_coupon(rows)
+
+    assert [code for code, _ in grouped] == ["ABC", "SAVE10", "save10"]
+    assert [(r.keyword, r.location) for r in grouped[1][1]] == [
+        ("alpha", "DE"),
+        ("Alpha", "UK"),
+    ]
+
+
+def test_format_performance_section_orders_by_revenue() -> None:
+    trends = {
+        "LOW": CouponPerformanceTrend(
+            coupon_code="LOW", this_week_revenue=10.0, prev_week_revenue=20.0
+        ),
+        "HIGH": CouponPerformanceTrend(
+            coupon_code="HIGH", this_week_revenue=1500.0
+        ),
+    }
+
+    blocks = SlackClient._format_performance_section(trends)
+
+    assert blocks[0] == {"type": "divider"}
+    texts = [b["text"]["text"] for b in blocks[1:]]
+    assert texts[0] == "*Coupon Performance (week over week)*"
+    assert texts[1].startswith("*`HIGH`*")
+    assert "• This week: $1,500.00 (0 txns)" in texts[1]
+    assert "• Change: +$1,500.00 (new)" in texts[1]
+    assert "• Change: $-10.00 (-50.0%)" in texts[2]
@@ -0,0 +1,35 @@
+"""Tests for data models."""
+
+from __future__ import annotations
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from coupon_mention_tracker.core.models import AIOverviewResult
+
+
+def _result(sources) -> AIOverviewResult:
+    return AIOverviewResult(
+        id=uuid4(),
+        prompt_id=uuid4(),
+        provider="google_ai_overview",
+        scraped_date=date(2026, 1, 1),
+        sources=sources,
+    )
+
+
+@pytest.mark.parametrize(
+    "raw",
+    ['[{"url": "https://a.example"}]', b'[{"url": "https://a.example"}]'],
+)
+def test_parse_sources_decodes_json_payloads(raw) -> None:
+    assert _result(raw).sources == [{"url": "https://a.example"}]
+
+
+@pytest.mark.parametrize(
+    "raw", ["not json", '{"url": "x"}', b"", {"url": "x"}, 42]
+)
+def test_parse_sources_drops_invalid_payloads(raw) -> None:
+    assert _result(raw).sources is None
@@ -100,6 +100,57 @@ async def test_connect_and_disconnect_use_pool(monkeypatch) -> None:
     assert DatabasePool._pool is None
 
 
+@pytest.mark.asyncio
+async def test_connect_sizes_pool_from_settings(monkeypatch) -> None:
+    captured = {}
+
+    async def _create_pool(*_args, **kwargs):
+        captured.update(kwargs)
+        return MagicMock()
+
+    monkeypatch.setattr("asyncpg.create_pool", _create_pool)
+
+    settings = _make_mock_settings()
+    settings.db_pool_min_size = 2
+    settings.db_pool_max_size = 25
+    settings.db_pool_max_queries = 50000
+    settings.db_pool_max_inactive_lifetime = 300.0
+
+    await AIOverviewRepository(settings).connect()
+
+    assert captured["min_size"] == 2
+    assert captured["max_size"] == 25
+    assert captured["max_queries"] == 50000
+    assert captured["max_inactive_connection_lifetime"] == 300.0
+
+
+@pytest.mark.asyncio
+async def test_init_connection_registers_json_codecs() -> None:
+    codecs = {}
+
+    class _Conn:
+        async def set_type_codec(
+            self, typename, *, encoder, decoder, schema, format="text"
+        ):
+            assert schema == "pg_catalog"
+            codecs[typename] = (encoder, decoder, format)
+
+    await DatabasePool._init_connection(cast(asyncpg.Connection, _Conn()))
+
+    assert set(codecs) == {"json", "jsonb"}
+    sources = [{"url": "https://example.com"}]
+
+    encoder, decoder, fmt = codecs["json"]
+    assert fmt == "text"
+    assert decoder(encoder(sources)) == sources
+
+    encoder, decoder, fmt = codecs["jsonb"]
+    assert fmt == "binary"
+    encoded = encoder(sources)
+    assert encoded.startswith(b"\x01")
+    assert decoder(encoded) == sources
+
+
 @pytest.mark.asyncio
 async def test_get_prompts_maps_rows_to_models() -> None:
     now = datetime(2026, 1, 1, 0, 0, 0)
@@ -172,6 +223,43 @@ async def test_get_results_for_period_maps_rows_to_models() -> None:
     assert result.scraped_date == scraped
 
 
+@pytest.mark.asyncio
+async def test_get_results_for_period_shares_prompt_across_results() -> None:
+    prompt_id = uuid4()
+    base = {
+        "prompt_id": prompt_id,
+        "prompt_text": "k",
+        "primary_product": "p",
+        "location": "US",
+        "status": "active",
+        "prompt_created_at": None,
+        "provider": "google",
+        "scraped_date": date(2026, 1, 2),
+        "scraped_at": None,
+        "response_text": "text",
+        "ahrefs_volume": None,
+        "sentiment_label": None,
+    }
+    rows = [
+        {**base, "result_id": uuid4(), "sources": [{"url": "https://a"}]},
+        {**base, "result_id": uuid4(), "sources": '[{"url": "https://b"}]'},
+        {**base, "result_id": uuid4(), "sources": {"url": "https://c"}},
+    ]
+    DatabasePool._pool = cast(asyncpg.Pool, _FakePool(_FakeConn(rows)))
+
+    repo = AIOverviewRepository(_make_mock_settings())
+    results = await repo.get_results_for_period(
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 7),
+    )
+
+    (first_prompt, first), (second_prompt, second), (_, third) = results
+    assert first_prompt is second_prompt
+    assert first.sources == [{"url": "https://a"}]
+    assert second.sources == [{"url": "https://b"}]
+    assert third.sources is None
+
+
 @pytest.mark.asyncio
 async def test_get_results_last_n_days_delegates_to_period(monkeypatch) -> None:
     repo = AIOverviewRepository(_make_mock_settings())
@@ -196,3 +284,29 @@ async def test_get_results_last_n_days_delegates_to_period(monkeypatch) -> None:
     assert called["provider"] == "google"
     assert called["end_date"] == date.today()
     assert called["tags"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_sources_with_html_groups_rows_by_result() -> None:
+    first, second = uuid4(), uuid4()
+    rows = [
+        {
+            "id": index,
+            "source_url": f"https://example.com/{index}",
+            "source_domain": "example.com",
+            "source_html_content": "<p>SAVE10</p>",
+            "page_title": None,
+            "scraped_at": None,
+            "scrape_status": "success",
+            "result_id": result_id,
+        }
+        for index, result_id in enumerate((first, second, first))
+    ]
+    DatabasePool._pool = cast(asyncpg.Pool, _FakePool(_FakeConn(rows)))
+
+    repo = AIOverviewRepository(_make_mock_settings())
+    sources = await repo.get_sources_with_html([first, second])
+
+    assert [s["id"] for s in sources[str(first)]] == [0, 2]
+    assert [s["id"] for s in sources[str(second)]] == [1]
+    assert "result_id" not in sources[str(first)][0]
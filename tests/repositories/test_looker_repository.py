@@ -0,0 +1,100 @@
+"""Unit tests for LookerRepository (no real database connections)."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import cast
+
+import asyncpg
+import pytest
+
+from coupon_mention_tracker.clients.database import DatabasePool
+from coupon_mention_tracker.repositories import sql_queries
+from coupon_mention_tracker.repositories.looker import LookerRepository
+
+
+class _FakeConn:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+        self.copied: list[tuple] = []
+        self.in_transaction = False
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.in_transaction = True
+        yield
+        self.in_transaction = False
+
+    async def execute(self, query, *params):
+        assert self.in_transaction
+        assert not params
+        self.executed.append(query)
+
+    async def copy_records_to_table(self, table_name, *, records, columns):
+        assert self.in_transaction
+        self.copied.append((table_name, records, columns))
+
+
+class _FakePool:
+    def __init__(self, conn: _FakeConn) -> None:
+        self._conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self._conn
+
+
+@pytest.fixture
+def conn():
+    old_pool = DatabasePool._pool
+    fake_conn = _FakeConn()
+    DatabasePool._pool = cast(asyncpg.Pool, _FakePool(fake_conn))
+    yield fake_conn
+    DatabasePool._pool = old_pool
+
+
+def _record(keyword: str, location: str | None, **overrides) -> dict:
+    return {
+        "keyword": keyword,
+        "location": location,
+        "scraped_date": date(2026, 1, 1),
+        "has_ai_overview": True,
+        **overrides,
+    }
+
+
+@pytest.mark.asyncio
+async def test_save_tracking_batch_skips_empty_batches(conn) -> None:
+    assert await LookerRepository().save_tracking_batch([]) == 0
+    assert conn.executed == []
+
+
+@pytest.mark.asyncio
+async def test_save_tracking_batch_copies_into_staging_then_upserts(
+    conn,
+) -> None:
+    records = [
+        _record("k1", "US", detected_coupon_code="OLD"),
+        _record("k2", None),
+        _record("k2", None),
+        _record("k1", "US", detected_coupon_code="NEW"),
+    ]
+
+    saved = await LookerRepository().save_tracking_batch(records)
+
+    assert saved == len(records)
+    assert conn.executed == [
+        sql_queries.CREATE_TRACKING_STAGING_TABLE,
+        sql_queries.UPSERT_TRACKING_HISTORY_FROM_STAGING,
+    ]
+    ((table, rows, columns),) = conn.copied
+    assert table == sql_queries.TRACKING_STAGING_TABLE
+    assert columns == sql_queries.TRACKING_HISTORY_COLUMNS
+    # Duplicate keys collapse to the last record; NULL locations are kept.
+    assert [(row[0], row[1], row[6]) for row in rows] == [
+        ("k1", "US", "NEW"),
+        ("k2", None, None),
+        ("k2", None, None),
+    ]
+    assert all(len(row) == len(columns) for row in rows)
@@ -36,6 +36,14 @@ def test_find_matches_does_not_match_substrings() -> None:
     assert matcher.find_matches("Use ABCD") == []
 
 
+def test_is_valid_coupon_is_case_insensitive() -> None:
+    matcher = CouponMatcher([" save10 ", ""])
+
+    assert matcher.is_valid_coupon("Save10") is True
+    assert matcher.is_valid_coupon("SAVE100") is False
+    assert matcher.tracked_coupons == ["SAVE10"]
+
+
 def test_find_any_coupon_pattern_finds_untracked_codes() -> None:
     matcher = CouponMatcher([])
     found = matcher.find_any_coupon_pattern("Try code: abc123 and NORDVPNDEAL")
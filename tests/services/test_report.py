@@ -100,9 +100,10 @@ async def test_generate_report_builds_rows_and_matches() -> None:
     notifier = _FakeNotifier()
     generator = WeeklyReportGenerator(repo, matcher, notifier)
 
-    rows, matches = await generator.generate_report(days=7)
+    rows, matches, results = await generator.generate_report(days=7)
 
     assert len(matches) == 2
+    assert results == repo._results
 
     row_by_key = {(row.keyword, row.coupon_detected): row for row in rows}
     match_row = row_by_key[("nordvpn coupon", "SAVE10")]
@@ -139,6 +140,17 @@ async def test_run_and_send_calls_notifier() -> None:
     assert len(notifier.sent) == 1
 
 
+@pytest.mark.asyncio
+async def test_run_and_send_skips_empty_report() -> None:
+    notifier = _FakeNotifier()
+    generator = WeeklyReportGenerator(
+        _FakeRepo([]), CouponMatcher(["SAVE10"]), notifier
+    )
+
+    assert await generator.run_and_send(days=7) is True
+    assert notifier.sent == []
+
+
 @pytest.mark.asyncio
 async def test_get_invalid_coupon_alerts_detects_untracked_patterns() -> None:
     prompt = AIOverviewPrompt(
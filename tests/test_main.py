@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import date
+from uuid import uuid4
+
 import pytest
+from loguru import logger
 
 from coupon_mention_tracker import main
+from coupon_mention_tracker.clients.slack import SlackClient
 from coupon_mention_tracker.core.config import Settings
+from coupon_mention_tracker.core.models import (
+    AIOverviewPrompt,
+    AIOverviewResult,
+    CouponMatch,
+    WeeklyReportRow,
+)
+from coupon_mention_tracker.services.coupon_matcher import CouponMatcher
 
 
 def test_fetch_coupons_from_google_sheets_uses_settings(monkeypatch) -> None:
@@ -67,7 +80,6 @@ async def test_run_weekly_report_disconnects_repository_on_connect_failure(
         },
     )()
 
-    monkeypatch.setattr(main, "get_settings", lambda: settings)
     monkeypatch.setattr(
         main, "fetch_coupons_from_google_sheets", lambda _s: ["SAVE10"]
     )
@@ -81,7 +93,186 @@ async def test_run_weekly_report_disconnects_repository_on_connect_failure(
 
     monkeypatch.setattr(main, "AIOverviewRepository", _repo_factory)
 
-    code = await main.run_weekly_report(days=7, send_slack=False)
+    code = await main.run_weekly_report(
+        days=7, send_slack=False, settings=settings
+    )
 
     assert code == 1
     assert created["repo"].disconnected is True
+
+
+@pytest.mark.asyncio
+async def test_run_weekly_report_cancels_connect_on_sheets_failure(
+    monkeypatch,
+) -> None:
+    events: list[str] = []
+
+    class _Repo:
+        def __init__(self, database_url: str) -> None:
+            self.database_url = database_url
+            self.pool_open = False
+
+        async def connect(self) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                events.append("connect cancelled")
+                raise
+            self.pool_open = True
+
+        async def disconnect(self) -> None:
+            events.append("disconnect")
+            self.pool_open = False
+
+    settings = type(
+        "S",
+        (),
+        {
+            "database_url_str": "postgresql://example",
+            "slack_webhook_url": "https://example.invalid",
+            "slack_channel": "#x",
+            "report_lookback_days": 7,
+        },
+    )()
+
+    def _fail_fetch(_settings) -> list[str]:
+        raise RuntimeError("sheets down")
+
+    monkeypatch.setattr(main, "fetch_coupons_from_google_sheets", _fail_fetch)
+
+    created = {}
+
+    def _repo_factory(url: str) -> _Repo:
+        repo = _Repo(url)
+        created["repo"] = repo
+        return repo
+
+    monkeypatch.setattr(main, "AIOverviewRepository", _repo_factory)
+
+    code = await main.run_weekly_report(
+        days=7, send_slack=False, settings=settings
+    )
+
+    assert code == 1
+    assert events == ["connect cancelled", "disconnect"]
+    assert created["repo"].pool_open is False
+
+
+def test_build_tracking_records_uses_first_match_per_result() -> None:
+    scraped = date(2026, 1, 1)
+    matched = AIOverviewPrompt(
+        id=uuid4(), prompt_text="k1", primary_product="p", location="US"
+    )
+    unmatched = AIOverviewPrompt(
+        id=uuid4(), prompt_text="k2", primary_product="p", location=None
+    )
+    results = [
+        (
+            prompt,
+            AIOverviewResult(
+                id=uuid4(),
+                prompt_id=prompt.id,
+                provider="google",
+                scraped_date=scraped,
+            ),
+        )
+        for prompt in (matched, unmatched)
+    ]
+    matches = [
+        CouponMatch(
+            keyword="k1",
+            location="US",
+            product="p",
+            scraped_date=scraped,
+            coupon_code=code,
+            match_context=f"use {code}",
+            ai_overview_id=results[0][1].id,
+            source_urls_with_mentions=["https://a.example"],
+        )
+        for code in ("SAVE10", "OLD10")
+    ]
+
+    records = main.build_tracking_records(
+        results, matches, CouponMatcher(["SAVE10"])
+    )
+
+    first, second = records
+    assert first["detected_coupon_code"] == "SAVE10"
+    assert first["is_valid_coupon"] is True
+    assert first["source_mention_count"] == 1
+    assert first["tracked_coupon_present"] is True
+    assert second["tracked_coupon_present"] is False
+    assert second["detected_coupon_code"] is None
+    assert second["source_urls_with_mentions"] == []
+    assert second["ai_overview_result_id"] == results[1][1].id
+
+
+@pytest.mark.asyncio
+async def test_save_tracking_records_reports_failure(monkeypatch) -> None:
+    class _Repo:
+        async def save_tracking_batch(self, records):
+            raise RuntimeError(f"boom ({len(records)})")
+
+    monkeypatch.setattr(main, "LookerRepository", _Repo)
+
+    assert await main._save_tracking_records([]) is True
+    assert await main._save_tracking_records([{"keyword": "k"}]) is False
+
+
+def _report_row(**overrides) -> WeeklyReportRow:
+    fields = {
+        "keyword": "k",
+        "location": "US",
+        "product": "p",
+        "has_ai_overview": True,
+        "coupon_detected": None,
+        "is_valid_coupon": None,
+        "first_seen": None,
+        "last_seen": None,
+    }
+    return WeeklyReportRow(**(fields | overrides))
+
+
+@pytest.mark.asyncio
+async def test_send_slack_report_reports_failure() -> None:
+    class _Notifier:
+        has_report_data = staticmethod(SlackClient.has_report_data)
+
+        async def send_weekly_report(self, **kwargs):
+            raise RuntimeError(f"boom ({len(kwargs)})")
+
+    ok = await main._send_slack_report(
+        _Notifier(), [_report_row()], date(2026, 1, 1), date(2026, 1, 8), None
+    )
+
+    assert ok is False
+
+
+@pytest.mark.asyncio
+async def test_send_slack_report_logs_skip_for_empty_report() -> None:
+    sent = []
+
+    class _Notifier:
+        has_report_data = staticmethod(SlackClient.has_report_data)
+
+        async def send_weekly_report(self, **kwargs):
+            sent.append(kwargs)
+            return True
+
+    messages: list[str] = []
+    sink_id = logger.add(lambda message: messages.append(message.rstrip()))
+    try:
+        ok = await main._send_slack_report(
+            _Notifier(),
+            [_report_row(has_ai_overview=False)],
+            date(2026, 1, 1),
+            date(2026, 1, 8),
+            None,
+        )
+    finally:
+        logger.remove(sink_id)
+
+    assert ok is True
+    assert sent == []
+    assert any("skipped" in message for message in messages)
+    assert not any("sent to Slack" in message for message in messages)